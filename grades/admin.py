@@ -1,6 +1,14 @@
+from django import forms
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.utils.text import smart_split, unescape_string_literal
 from .models import User, Subject, Grade
+from .admin_paginator import FasterAdminPaginator
+from .signals import SUBJECT_FILTER_CACHE_KEY
 
 
 class UserAdmin(BaseUserAdmin):
@@ -26,12 +34,63 @@ class UserAdmin(BaseUserAdmin):
     
     search_fields = ('email', 'first_name', 'last_name')
     ordering = ('email',)
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+
+
+class SubjectListFilter(admin.SimpleListFilter):
+    """
+    Subject filter for the grade changelist.
+    The choices come from the Subject table (cached) instead of scanning Grade.
+    """
+    title = 'subject'
+    parameter_name = 'subject'
+
+    def lookups(self, request, model_admin):
+        return cache.get_or_set(
+            SUBJECT_FILTER_CACHE_KEY,
+            lambda: list(Subject.objects.order_by('name').values_list('id', 'name')),
+            300,
+        )
+
+    def queryset(self, request, queryset):
+        if self.value():
+            try:
+                return queryset.filter(subject_id=self.value())
+            except (ValueError, ValidationError) as e:
+                raise IncorrectLookupParameters(e)
+        return queryset
+
+
+class GradeAdminForm(forms.ModelForm):
+    """Lets admins enter the grade in points instead of hundredths"""
+    grade = forms.DecimalField(
+        max_digits=5, decimal_places=2, min_value=0, max_value=100, required=False,
+        help_text="Grade value between 0 and 100"
+    )
+
+    class Meta:
+        model = Grade
+        exclude = ('grade_centi',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            self.initial.setdefault('grade', self.instance.grade)
+
+    def save(self, commit=True):
+        self.instance.grade = self.cleaned_data.get('grade')
+        return super().save(commit)
 
 
 class GradeAdmin(admin.ModelAdmin):
-    list_display = ('student', 'subject', 'grade', 'semester', 'school_year', 'created_at')
-    list_filter = ('subject', 'semester', 'school_year', 'created_at')
+    form = GradeAdminForm
+    list_display = ('student', 'subject', 'grade_points', 'semester', 'school_year', 'created_at')
+    list_filter = (SubjectListFilter, 'semester', 'school_year', 'created_at')
     search_fields = ('student__email', 'student__first_name', 'student__last_name', 'subject__name')
+    list_select_related = ('student', 'subject')
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Student and Subject', {'fields': ('student', 'subject')}),
@@ -41,6 +100,24 @@ class GradeAdmin(admin.ModelAdmin):
     
     readonly_fields = ('created_at', 'updated_at')
 
+    @admin.display(ordering='grade_centi', description='Grade')
+    def grade_points(self, obj):
+        return obj.grade
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Match each search word through pk__in subqueries instead of the default
+        joins, so multi-word searches don't multiply the joined rows.
+        """
+        for word in smart_split(search_term):
+            if word.startswith(('"', "'")) and word[0] == word[-1]:
+                word = unescape_string_literal(word)
+            matches = Q()
+            for field in self.search_fields:
+                matches |= Q(pk__in=Grade.objects.filter(**{f'{field}__icontains': word}).values('pk'))
+            queryset = queryset.filter(matches)
+        return queryset, False
+
 
 class SubjectAdmin(admin.ModelAdmin):
     list_display = ('name', 'description', 'created_at')
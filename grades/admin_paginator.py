@@ -0,0 +1,28 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Paginator for admin changelists on large tables.
+    On PostgreSQL an unfiltered changelist uses the planner's row estimate
+    instead of running COUNT(*) over the whole table.
+    Other databases (and filtered lists) fall back to the exact count.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 (or missing) until the table has been analyzed
+            if row and row[0] > 0:
+                return row[0]
+        return super().count
@@ -0,0 +1,47 @@
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+# Only the user columns the views and permissions read are loaded and cached
+CACHED_USER_FIELDS = (
+    'id', 'email', 'first_name', 'last_name',
+    'is_admin', 'is_student', 'is_active', 'is_staff', 'is_superuser',
+)
+
+
+def token_cache_key(key):
+    return f'auth-token:{key}'
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication that caches the resolved (user, token) pair,
+    so repeated requests with the same token skip the token/user SELECT.
+    Entries are dropped when the token is deleted or the user is saved (see signals).
+    With a per-process cache (the default LocMemCache) that only clears the process
+    that made the change; other workers may keep accepting the old credentials
+    for up to cache_timeout seconds.
+    """
+    cache_timeout = 60
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        credentials = cache.get(cache_key)
+        if credentials is not None:
+            return credentials
+
+        model = self.get_model()
+        try:
+            token = model.objects.select_related('user').only(
+                'key', 'user', *(f'user__{field}' for field in CACHED_USER_FIELDS)
+            ).get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        credentials = (token.user, token)
+        cache.set(cache_key, credentials, self.cache_timeout)
+        return credentials
@@ -0,0 +1,40 @@
+from decimal import Decimal
+
+import django.core.validators
+from django.db import migrations, models
+
+
+def copy_grade_to_centi(apps, schema_editor):
+    Grade = apps.get_model('grades', 'Grade')
+    grades = list(Grade.objects.exclude(grade=None).only('id', 'grade'))
+    for grade in grades:
+        grade.grade_centi = int(round(grade.grade * 100))
+    Grade.objects.bulk_update(grades, ['grade_centi'], batch_size=1000)
+
+
+def copy_centi_to_grade(apps, schema_editor):
+    Grade = apps.get_model('grades', 'Grade')
+    grades = list(Grade.objects.exclude(grade_centi=None).only('id', 'grade_centi'))
+    for grade in grades:
+        grade.grade = Decimal(grade.grade_centi).scaleb(-2)
+    Grade.objects.bulk_update(grades, ['grade'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('grades', '0002_alter_grade_unique_together'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='grade',
+            name='grade_centi',
+            field=models.SmallIntegerField(blank=True, help_text='Grade value between 0 and 100, stored in hundredths', null=True, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(10000)]),
+        ),
+        migrations.RunPython(copy_grade_to_centi, copy_centi_to_grade),
+        migrations.RemoveField(
+            model_name='grade',
+            name='grade',
+        ),
+    ]
@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -107,13 +109,12 @@ class Grade(models.Model):
     )
     
     # Grade can be blank initially (null=True, blank=True)
-    grade = models.DecimalField(
-        max_digits=5,
-        decimal_places=2,
+    # Stored in hundredths (e.g. 85.50 -> 8550) so the column is a small integer
+    grade_centi = models.SmallIntegerField(
         null=True,
         blank=True,
-        validators=[MinValueValidator(0), MaxValueValidator(100)],
-        help_text="Grade value between 0 and 100"
+        validators=[MinValueValidator(0), MaxValueValidator(10000)],
+        help_text="Grade value between 0 and 100, stored in hundredths"
     )
     
     # Additional fields
@@ -131,13 +132,37 @@ class Grade(models.Model):
         # Note: We don't use unique_together here because students can retake subjects
         ordering = ['-created_at']
         unique_together = ('student', 'subject')
+        # Lookups by (subject, student) use the unique_together index, and lookups by
+        # subject or student alone use the ForeignKey indexes, so no extra indexes are needed.
     
     def __str__(self):
         grade_display = self.grade if self.grade is not None else "No Grade Yet"
         return f"{self.student.get_full_name()} - {self.subject.name}: {grade_display}"
     
+    @staticmethod
+    def to_centi(value):
+        """Convert a grade value (e.g. 85.5) to hundredths (8550)"""
+        if value is None:
+            return None
+        return int(round(Decimal(str(value)) * 100))
+    
+    @staticmethod
+    def from_centi(value):
+        """Convert hundredths (8550) back to a grade value (Decimal('85.50'))"""
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-2)
+    
+    @property
+    def grade(self):
+        return self.from_centi(self.grade_centi)
+    
+    @grade.setter
+    def grade(self, value):
+        self.grade_centi = self.to_centi(value)
+    
     def is_passing(self, passing_grade=75):
         """Helper method to check if grade is passing"""
-        if self.grade is None:
+        if self.grade_centi is None:
             return None
-        return self.grade >= passing_grade
\ No newline at end of file
+        return self.grade_centi >= passing_grade * 100
\ No newline at end of file
@@ -0,0 +1,11 @@
+from rest_framework.pagination import PageNumberPagination
+
+
+class GradePagination(PageNumberPagination):
+    """
+    Page size cap for grade listings.
+    Clients can ask for a different size with ?page_size=, up to max_page_size.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
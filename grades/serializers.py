@@ -11,10 +11,42 @@ class SubjectSerializer(serializers.ModelSerializer):
         model = Subject
         fields = ['id', 'name', 'description']
 
+class PrefetchedGradeField(serializers.DecimalField):
+    """Reads the grade from the subject's prefetched my_grades (None if not enrolled)"""
+
+    def get_attribute(self, instance):
+        my_grades = getattr(instance, 'my_grades', None)
+        return my_grades[0].grade if my_grades else None
+
+class StudentSubjectSerializer(SubjectSerializer):
+    """Subject plus the requesting student's grade (from the prefetched my_grades)"""
+    # Same format as GradeSerializer.grade (e.g. "90.00")
+    my_grade = PrefetchedGradeField(max_digits=5, decimal_places=2, read_only=True)
+
+    class Meta(SubjectSerializer.Meta):
+        fields = SubjectSerializer.Meta.fields + ['my_grade']
+
 class GradeSerializer(serializers.ModelSerializer):
-    student = UserSerializer(read_only=True)
-    subject = SubjectSerializer(read_only=True)
+    # Flat read-only student/subject columns instead of nested serializers,
+    # so each row is built without extra serializer instances
+    student_id = serializers.IntegerField(read_only=True)
+    student_email = serializers.EmailField(source='student.email', read_only=True)
+    student_first_name = serializers.CharField(source='student.first_name', read_only=True)
+    student_last_name = serializers.CharField(source='student.last_name', read_only=True)
+    subject_id = serializers.IntegerField(read_only=True)
+    subject_name = serializers.CharField(source='subject.name', read_only=True)
+    subject_description = serializers.CharField(source='subject.description', read_only=True)
+    # Exposed in points; the model stores it in hundredths (Grade.grade_centi)
+    grade = serializers.DecimalField(
+        max_digits=5, decimal_places=2, min_value=0, max_value=100,
+        allow_null=True, required=False
+    )
 
     class Meta:
         model = Grade
-        fields = ['id', 'student', 'subject', 'grade', 'semester', 'school_year', 'remarks']
+        fields = [
+            'id',
+            'student_id', 'student_email', 'student_first_name', 'student_last_name',
+            'subject_id', 'subject_name', 'subject_description',
+            'grade', 'semester', 'school_year', 'remarks',
+        ]
@@ -0,0 +1,35 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from rest_framework.authtoken.models import Token
+
+from .authentication import token_cache_key
+from .models import Subject, User
+
+# Cache key for the serialized public subject list (see PublicSubjectListView)
+PUBLIC_SUBJECTS_CACHE_KEY = 'public-subjects'
+# Cache key for the subject choices of the grade admin filter (see SubjectListFilter)
+SUBJECT_FILTER_CACHE_KEY = 'grade-admin-subject-lookups'
+
+
+@receiver([post_save, post_delete], sender=Subject)
+def invalidate_subject_caches(sender, **kwargs):
+    """Drop the cached subject lists whenever a subject changes"""
+    cache.delete_many([PUBLIC_SUBJECTS_CACHE_KEY, SUBJECT_FILTER_CACHE_KEY])
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance, update_fields=None, **kwargs):
+    """Drop cached token credentials so changes to the user (e.g. deactivation) are picked up"""
+    # Logins only touch last_login, which the cached credentials don't depend on
+    if update_fields and set(update_fields) == {'last_login'}:
+        return
+    keys = Token.objects.filter(user=instance).values_list('key', flat=True)
+    cache.delete_many([token_cache_key(key) for key in keys])
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """Stop accepting a deleted token from the cache"""
+    cache.delete(token_cache_key(instance.key))
@@ -1,3 +1,127 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from .models import User, Subject, Grade
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='student@example.com', password='pass1234', first_name='Test', last_name='Student'
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = reverse('subject-list')
+
+    def test_valid_token_is_accepted(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        # Second request is served from the cached credentials
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    def test_deactivated_user_is_rejected(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        self.user.is_active = False
+        self.user.save()
+
+        # SessionAuthentication is listed first, so failed credentials give 403 (no WWW-Authenticate)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_deleted_token_is_rejected(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        self.token.delete()
+
+        # SessionAuthentication is listed first, so failed credentials give 403 (no WWW-Authenticate)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class BulkUpdateGradesViewTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password='pass1234', first_name='Test', last_name='Admin',
+            is_admin=True, is_student=False
+        )
+        self.student = User.objects.create_user(
+            email='student@example.com', password='pass1234', first_name='Test', last_name='Student'
+        )
+        self.subject = Subject.objects.create(name='Math')
+        self.enrollment = Grade.objects.create(student=self.student, subject=self.subject, grade=50)
+        self.client.force_authenticate(self.admin)
+        self.url = reverse('bulk-update-grades', kwargs={'subject_id': self.subject.pk})
+
+    def test_updates_enrolled_students(self):
+        response = self.client.put(self.url, [
+            {"student_id": self.student.pk, "grade": 90},
+            {"student_id": self.student.pk + 100, "grade": 80},
+        ], format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated"], [self.student.pk])
+        self.assertEqual(response.data["not_enrolled"], [self.student.pk + 100])
+        self.enrollment.refresh_from_db()
+        self.assertEqual(self.enrollment.grade, 90)
+
+    def test_rejects_non_integer_student_id(self):
+        for student_id in (self.student.pk + 0.9, True, str(self.student.pk)):
+            response = self.client.put(self.url, [{"student_id": student_id, "grade": 10}], format='json')
+            self.assertEqual(response.status_code, 400, student_id)
+        self.enrollment.refresh_from_db()
+        self.assertEqual(self.enrollment.grade, 50)
+
+    def test_rejects_invalid_payload(self):
+        for payload in ({}, [], [{"student_id": self.student.pk}], [{"student_id": self.student.pk, "grade": 101}]):
+            response = self.client.put(self.url, payload, format='json')
+            self.assertEqual(response.status_code, 400, payload)
+
+
+class BulkEnrollViewTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password='pass1234', first_name='Test', last_name='Admin',
+            is_admin=True, is_student=False
+        )
+        self.enrolled = User.objects.create_user(
+            email='enrolled@example.com', password='pass1234', first_name='Already', last_name='Enrolled'
+        )
+        self.new_student = User.objects.create_user(
+            email='new@example.com', password='pass1234', first_name='New', last_name='Student'
+        )
+        self.subject = Subject.objects.create(name='Math')
+        Grade.objects.create(student=self.enrolled, subject=self.subject)
+        self.client.force_authenticate(self.admin)
+        self.url = reverse('bulk-enroll-subject', kwargs={'subject_id': self.subject.pk})
+
+    def test_splits_enrolled_already_enrolled_and_not_found(self):
+        missing_id = self.new_student.pk + 100
+        response = self.client.post(self.url, {
+            "student_ids": [self.new_student.pk, self.enrolled.pk, self.admin.pk, missing_id],
+        }, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["enrolled"], [self.new_student.pk])
+        self.assertEqual(response.data["already_enrolled"], [self.enrolled.pk])
+        # Non-students count as not found
+        self.assertEqual(response.data["not_found"], sorted([self.admin.pk, missing_id]))
+        self.assertTrue(Grade.objects.filter(student=self.new_student, subject=self.subject).exists())
+
+    def test_rejects_invalid_payload(self):
+        for payload in (
+            [self.new_student.pk],
+            {},
+            {"student_ids": []},
+            {"student_ids": [True]},
+            {"student_ids": [self.new_student.pk + 0.9]},
+            {"student_ids": [str(self.new_student.pk)]},
+        ):
+            response = self.client.post(self.url, payload, format='json')
+            self.assertEqual(response.status_code, 400, payload)
+        self.assertFalse(Grade.objects.filter(student=self.new_student).exists())
+
+    def test_unknown_subject(self):
+        url = reverse('bulk-enroll-subject', kwargs={'subject_id': self.subject.pk + 100})
+        response = self.client.post(url, {"student_ids": [self.new_student.pk]}, format='json')
+        self.assertEqual(response.status_code, 404)
@@ -2,7 +2,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import PublicSubjectListView, UserViewSet, SubjectViewSet, GradeViewSet, SubjectDetailView, EnrollSubjectView, RemoveStudentFromSubjectView
-from .views import UpdateStudentGradeView
+from .views import UpdateStudentGradeView, BulkEnrollView, BulkUpdateGradesView
 
 
 router = DefaultRouter()
@@ -15,8 +15,10 @@ urlpatterns = [
     path('public/subjects/', PublicSubjectListView.as_view(), name='public-subjects-list'),
     path('subjects/<int:pk>/details/', SubjectDetailView.as_view(), name='subject-detail'),
     path('subjects/<int:subject_id>/enroll/', EnrollSubjectView.as_view(), name='enroll-subject'),
+    path('subjects/<int:subject_id>/bulk-enroll/', BulkEnrollView.as_view(), name='bulk-enroll-subject'),
     path('subjects/<int:subject_id>/remove/<int:student_id>/', RemoveStudentFromSubjectView.as_view(), name='remove-student'),
     path('subjects/<int:subject_id>/update-grade/<int:student_id>/', UpdateStudentGradeView.as_view(), name='update-grade'),
+    path('subjects/<int:subject_id>/bulk-update-grades/', BulkUpdateGradesView.as_view(), name='bulk-update-grades'),
 
 
 
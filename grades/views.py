@@ -1,4 +1,8 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
 from django.shortcuts import render
+from django.utils import timezone
 from rest_framework import viewsets, permissions, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
@@ -6,12 +10,15 @@ from rest_framework import generics
 from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
 from .models import User, Subject, Grade
-from .serializers import UserSerializer, SubjectSerializer, GradeSerializer
+from .serializers import UserSerializer, SubjectSerializer, StudentSubjectSerializer, GradeSerializer
 from .permission import IsAdminOrReadOnly
+from .pagination import GradePagination
+from .signals import PUBLIC_SUBJECTS_CACHE_KEY
 
 class RemoveStudentFromSubjectView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
+    @transaction.atomic
     def delete(self, request, subject_id, student_id):
         """
         Allows an admin to remove a student from a subject.
@@ -24,29 +31,22 @@ class RemoveStudentFromSubjectView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        # ✅ Check if subject exists
-        try:
-            subject = Subject.objects.get(pk=subject_id)
-        except Subject.DoesNotExist:
-            return Response({"error": "Subject not found."}, status=status.HTTP_404_NOT_FOUND)
-
-        # ✅ Check if student exists
-        try:
-            student = User.objects.get(pk=student_id, is_student=True)
-        except User.DoesNotExist:
-            return Response({"error": "Student not found."}, status=status.HTTP_404_NOT_FOUND)
-
-        # ✅ Check enrollment
-        try:
-            grade_record = Grade.objects.get(subject=subject, student=student)
-        except Grade.DoesNotExist:
+        # ✅ Look up (and lock) the enrollment together with its subject and student in one query
+        grade_record = (
+            Grade.objects.select_related('subject', 'student')
+            .select_for_update(of=('self',))
+            .only('grade_centi', 'subject', 'student', 'subject__name', 'student__first_name', 'student__last_name')
+            .filter(subject_id=subject_id, student_id=student_id, student__is_student=True)
+            .first()
+        )
+        if grade_record is None:
             return Response(
                 {"error": "This student is not enrolled in the subject."},
                 status=status.HTTP_404_NOT_FOUND
             )
 
         # ✅ Prevent removal if grade already exists
-        if grade_record.grade is not None:
+        if grade_record.grade_centi is not None:
             return Response(
                 {"error": "Cannot remove student — they already have a grade."},
                 status=status.HTTP_400_BAD_REQUEST
@@ -55,7 +55,7 @@ class RemoveStudentFromSubjectView(APIView):
         # ✅ Safe to remove
         grade_record.delete()
         return Response(
-            {"message": f"Student {student.get_full_name()} was successfully removed from {subject.name}."},
+            {"message": f"Student {grade_record.student.get_full_name()} was successfully removed from {grade_record.subject.name}."},
             status=status.HTTP_200_OK
         )
 
@@ -69,20 +69,50 @@ class SubjectViewSet(viewsets.ModelViewSet):
     serializer_class = SubjectSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_queryset(self):
+        queryset = Subject.objects.all()
+        # Admins take precedence, as in SubjectDetailView (superusers keep is_student=True)
+        is_student = self.request.user.is_student and not self.request.user.is_admin
+        if is_student and self.action in ('list', 'retrieve'):
+            # Load the student's own grades for all listed subjects in one extra query
+            queryset = queryset.prefetch_related(Prefetch(
+                'grades',
+                queryset=Grade.objects.filter(student=self.request.user).only('id', 'grade_centi', 'subject_id'),
+                to_attr='my_grades',
+            ))
+        if self.action == 'destroy':
+            # Lock the subject row so no grade can be added between the guard and the delete
+            queryset = queryset.select_for_update()
+        return queryset
+
+    def get_serializer_class(self):
+        if self.request.user.is_student and not self.request.user.is_admin:
+            return StudentSubjectSerializer
+        return SubjectSerializer
+
+    @transaction.atomic
     def destroy(self, request, *args, **kwargs):
+        # get_object() locks the subject (see get_queryset); inserting a grade for it
+        # has to wait for this transaction, so the guard holds until the delete commits
         subject = self.get_object()
-        if Grade.objects.filter(subject=subject).exists():
+        if subject.grades.exists():
             return Response(
                 {"error": "Cannot delete subject with associated grades."},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        return super().destroy(request, *args, **kwargs)
+        self.perform_destroy(subject)
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class GradeViewSet(viewsets.ModelViewSet):
     queryset = Grade.objects.all()
     serializer_class = GradeSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = GradePagination
+
+    def get_queryset(self):
+        # Join student and subject up front so the serializer's student_*/subject_* fields don't query per row
+        return Grade.objects.select_related('student', 'subject').order_by('-created_at')
 
 
 class SubjectDetailView(APIView):
@@ -91,29 +121,34 @@ class SubjectDetailView(APIView):
     def get(self, request, pk):
         """
         If student -> show their grade for the subject
-        If admin -> show all students and their grades (not paginated)
+        If admin -> show all students and their grades (paginated)
         """
         try:
-            subject = Subject.objects.get(pk=pk)
+            subject = Subject.objects.only('name').get(pk=pk)
         except Subject.DoesNotExist:
             return Response({"error": "Subject not found."}, status=status.HTTP_404_NOT_FOUND)
 
         # If admin: show all students with their grades
         if request.user.is_admin:
-            grades = Grade.objects.filter(subject=subject).select_related('student')
+            paginator = GradePagination()
+            rows = Grade.objects.filter(subject=subject).values(
+                'student__first_name', 'student__last_name', 'student__email', 'grade_centi', 'remarks'
+            )
             data = [
                 {
-                    "student": f"{grade.student.first_name} {grade.student.last_name}",
-                    "email": grade.student.email,
-                    "grade": grade.grade,
-                    "remarks": grade.remarks,
+                    "student": f"{row['student__first_name']} {row['student__last_name']}",
+                    "email": row['student__email'],
+                    "grade": Grade.from_centi(row['grade_centi']),
+                    "remarks": row['remarks'],
                 }
-                for grade in grades
+                for row in paginator.paginate_queryset(rows, request, view=self)
             ]
             return Response({
                 "subject": subject.name,
                 "students": data,
-                "total_students": len(data)
+                "total_students": paginator.page.paginator.count,
+                "next": paginator.get_next_link(),
+                "previous": paginator.get_previous_link(),
             })
 
         # If student: show their own grade
@@ -139,6 +174,15 @@ class PublicSubjectListView(generics.ListAPIView):
     queryset = Subject.objects.all().order_by('name')
     serializer_class = SubjectSerializer
     permission_classes = [AllowAny]
+    cache_timeout = 60
+
+    def list(self, request, *args, **kwargs):
+        # Subjects rarely change; the cached list is dropped by the Subject save/delete signals
+        data = cache.get(PUBLIC_SUBJECTS_CACHE_KEY)
+        if data is None:
+            data = self.get_serializer(self.get_queryset(), many=True).data
+            cache.set(PUBLIC_SUBJECTS_CACHE_KEY, data, self.cache_timeout)
+        return Response(data)
 
 class UpdateStudentGradeView(APIView):
     """
@@ -146,6 +190,7 @@ class UpdateStudentGradeView(APIView):
     """
     permission_classes = [permissions.IsAuthenticated]
 
+    @transaction.atomic
     def put(self, request, subject_id, student_id):
         # ✅ Only admins can perform this action
         if not request.user.is_admin:
@@ -154,27 +199,6 @@ class UpdateStudentGradeView(APIView):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        # ✅ Get the subject
-        try:
-            subject = Subject.objects.get(pk=subject_id)
-        except Subject.DoesNotExist:
-            return Response({"error": "Subject not found."}, status=status.HTTP_404_NOT_FOUND)
-
-        # ✅ Get the student
-        try:
-            student = User.objects.get(pk=student_id, is_student=True)
-        except User.DoesNotExist:
-            return Response({"error": "Student not found."}, status=status.HTTP_404_NOT_FOUND)
-
-        # ✅ Find grade record
-        try:
-            grade_record = Grade.objects.get(subject=subject, student=student)
-        except Grade.DoesNotExist:
-            return Response(
-                {"error": "Student is not enrolled in this subject."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-
         # ✅ Validate the new grade
         new_grade = request.data.get("grade")
         if new_grade is None:
@@ -188,18 +212,27 @@ class UpdateStudentGradeView(APIView):
         if not (0 <= new_grade <= 100):
             return Response({"error": "Grade must be between 0 and 100."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # ✅ Update and save
-        grade_record.grade = new_grade
-        grade_record.save()
+        # ✅ Update the enrollment in a single UPDATE (no subject/student/grade fetches)
+        enrollment = Grade.objects.filter(
+            subject_id=subject_id, student_id=student_id, student__is_student=True
+        )
+        updated = enrollment.update(grade_centi=Grade.to_centi(new_grade), updated_at=timezone.now())
+        if not updated:
+            return Response(
+                {"error": "Student is not enrolled in this subject."},
+                status=status.HTTP_404_NOT_FOUND
+            )
 
+        first_name, subject_name = enrollment.values_list('student__first_name', 'subject__name').get()
         return Response(
-            {"message": f"Updated {student.first_name}'s grade in {subject.name} to {new_grade}."},
+            {"message": f"Updated {first_name}'s grade in {subject_name} to {new_grade}."},
             status=status.HTTP_200_OK
         )
 
 class EnrollSubjectView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
+    @transaction.atomic
     def post(self, request, subject_id):
         """
         Allows a student to enroll in a subject.
@@ -210,22 +243,131 @@ class EnrollSubjectView(APIView):
             return Response({"error": "Only students can enroll in subjects."}, status=status.HTTP_403_FORBIDDEN)
 
         try:
-            subject = Subject.objects.get(pk=subject_id)
+            subject_name = Subject.objects.values_list('name', flat=True).get(pk=subject_id)
         except Subject.DoesNotExist:
             return Response({"error": "Subject not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        # ✅ Check if already enrolled
-        existing_enrollment = Grade.objects.filter(student=request.user, subject=subject).exists()
-        if existing_enrollment:
+        # ✅ Create new enrollment with blank grade, unless one already exists.
+        # The unique (student, subject) constraint guards against concurrent duplicates.
+        enrollment, created = Grade.objects.get_or_create(student=request.user, subject_id=subject_id)
+        if not created:
             return Response({"error": "You are already enrolled in this subject."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # ✅ Create new enrollment with blank grade
-        enrollment = Grade.objects.create(student=request.user, subject=subject)
         return Response({
-            "message": f"Successfully enrolled in {subject.name}.",
-            "subject": subject.name,
+            "message": f"Successfully enrolled in {subject_name}.",
+            "subject": subject_name,
             "student": request.user.get_full_name(),
             "grade": enrollment.grade  # Should be null/None initially
         }, status=status.HTTP_201_CREATED)
     
 
+def _is_id(value):
+    """True for real JSON integers only (not bools, floats like 2.9, or strings)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class BulkEnrollView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, subject_id):
+        """
+        Allows an admin to enroll many students in a subject at once.
+        Expects {"student_ids": [...]}; students already enrolled are skipped.
+        """
+        # ✅ Only admins can bulk-enroll students
+        if not request.user.is_admin:
+            return Response({"error": "Only admins can bulk-enroll students."}, status=status.HTTP_403_FORBIDDEN)
+
+        if not isinstance(request.data, dict):
+            return Response({"error": "Expected an object with a student_ids list."}, status=status.HTTP_400_BAD_REQUEST)
+
+        student_ids = request.data.get("student_ids")
+        if not isinstance(student_ids, list) or not student_ids:
+            return Response({"error": "student_ids must be a non-empty list."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not all(_is_id(student_id) for student_id in student_ids):
+            return Response({"error": "student_ids must contain only integers."}, status=status.HTTP_400_BAD_REQUEST)
+        student_ids = set(student_ids)
+
+        try:
+            subject_name = Subject.objects.values_list('name', flat=True).get(pk=subject_id)
+        except Subject.DoesNotExist:
+            return Response({"error": "Subject not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        # ✅ Keep only existing students who are not enrolled yet
+        valid_ids = set(
+            User.objects.filter(pk__in=student_ids, is_student=True).values_list('pk', flat=True)
+        )
+        enrolled_ids = set(
+            Grade.objects.filter(subject_id=subject_id, student_id__in=valid_ids).values_list('student_id', flat=True)
+        )
+        new_ids = valid_ids - enrolled_ids
+
+        # ✅ One multi-row INSERT; ignore_conflicts covers enrollments created concurrently
+        Grade.objects.bulk_create(
+            [Grade(student_id=student_id, subject_id=subject_id) for student_id in new_ids],
+            ignore_conflicts=True,
+            batch_size=5000,
+        )
+        return Response({
+            "message": f"Enrolled {len(new_ids)} student(s) in {subject_name}.",
+            "subject": subject_name,
+            "enrolled": sorted(new_ids),
+            "already_enrolled": sorted(enrolled_ids),
+            "not_found": sorted(student_ids - valid_ids),
+        }, status=status.HTTP_201_CREATED)
+
+
+class BulkUpdateGradesView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def put(self, request, subject_id):
+        """
+        Allows an admin to update the grades of many students in a subject at once.
+        Expects [{"student_id": ..., "grade": ...}, ...].
+        """
+        # ✅ Only admins can update grades
+        if not request.user.is_admin:
+            return Response({"error": "Only admins can update grades."}, status=status.HTTP_403_FORBIDDEN)
+
+        if not isinstance(request.data, list) or not request.data:
+            return Response(
+                {"error": "Expected a non-empty list of {student_id, grade} objects."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # ✅ Validate every entry before touching the database
+        new_grades = {}
+        for entry in request.data:
+            try:
+                student_id = entry["student_id"]
+                new_grade = entry["grade"]
+                if not _is_id(student_id) or isinstance(new_grade, bool):
+                    raise TypeError
+                new_grade = float(new_grade)
+            except (KeyError, TypeError, ValueError):
+                return Response(
+                    {"error": "Each entry needs an integer student_id and a numeric grade."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if not (0 <= new_grade <= 100):
+                return Response({"error": "Grade must be between 0 and 100."}, status=status.HTTP_400_BAD_REQUEST)
+            new_grades[student_id] = new_grade
+
+        # ✅ Load the enrollments in one query, then write them back in one batched UPDATE
+        grade_records = list(
+            Grade.objects.filter(subject_id=subject_id, student_id__in=new_grades, student__is_student=True)
+            .only('id', 'student_id', 'grade_centi', 'updated_at')
+        )
+        now = timezone.now()
+        for grade_record in grade_records:
+            grade_record.grade = new_grades[grade_record.student_id]
+            grade_record.updated_at = now
+        Grade.objects.bulk_update(grade_records, ['grade_centi', 'updated_at'], batch_size=10000)
+
+        updated_ids = {grade_record.student_id for grade_record in grade_records}
+        return Response({
+            "message": f"Updated {len(updated_ids)} grade(s).",
+            "updated": sorted(updated_ids),
+            "not_enrolled": sorted(set(new_grades) - updated_ids),
+        }, status=status.HTTP_200_OK)
@@ -128,6 +128,12 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'grades.User'
 
 REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        'rest_framework.authentication.SessionAuthentication',
+        'rest_framework.authentication.BasicAuthentication',
+        # Token auth for API clients (rest_framework.authtoken); tokens are issued in the admin
+        'grades.authentication.CachedTokenAuthentication',
+    ],
     'DEFAULT_PERMISSION_CLASS': 'rest_framework.paginition.PageNumberPagination',
     'PAGE_SIZE': 10
 }
\ No newline at end of file